@@ -3,13 +3,15 @@ Thread Classes Module
 Contains all worker thread classes for background processing in YouTube OSINT Tool.
 """
 
-import base64, csv, io, json, os, re, sys, time, urllib.parse, pathlib, random, math
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import csv, json, os, re, sys, time, urllib.parse, pathlib, math, hashlib, threading, shutil, heapq
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
 
 import requests
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from requests.adapters import HTTPAdapter
+from PyQt5.QtCore import QThread, pyqtSignal
 
 # Import yt-dlp
 try:
@@ -17,15 +19,361 @@ try:
 except ImportError:
     print("pip install yt-dlp")
     sys.exit(1)
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    print("pip install beautifulsoup4")
-    sys.exit(1)
+
+from utils import (CSV_HEADER, canonical_channel_url, canonical_video_url, extract_video_id_from_url,
+                   flatten_item, json_dumps, json_loads, parse_duration_from_iso)
 
 # Constants
 USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
               "(KHTML, like Gecko) Chrome/124.0 Safari/537.36")
+CACHE_DIR = pathlib.Path(".yt_osint_cache")
+SEARCH_CACHE_TTL = 86400    # search results and channel pages change daily
+VIDEO_CACHE_TTL = 604800    # finalized video metadata is stable for a week
+THUMBNAIL_CACHE_TTL = 604800  # profile images rarely change within a week
+MAX_FETCH_WORKERS = 8       # concurrent network fetches per worker thread
+COPY_BUFFER_SIZE = 1 << 20  # bytes per read when streaming downloads to disk
+HTTP_TIMEOUT = 15           # seconds
+HTTP_MAX_RETRIES = 3        # retries after a 429 Too Many Requests
+MAX_RETRY_AFTER = 30        # seconds; cap on a server-requested back-off
+DORK_QUERIES_PER_SECOND = 2.0
+DOCUMENT_QUERIES_PER_SECOND = 1.0
+MAX_COMMENTS = 20           # top-level comments fetched per video
+MAX_FILENAME_STEM = 80
+THUMBNAIL_QUALITIES = ('maxres', 'high', 'medium', 'default')  # best first
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\-. ]+')
+
+# yt-dlp option sets, shared by every call (and pooled instance) of each kind.
+# Search results use yt-dlp's flat listing so entries are not resolved one by one.
+YDL_SEARCH_OPTS = {
+    'quiet': True,
+    'extract_flat': 'in_playlist',
+    'skip_download': True,
+    'extractor_args': {'youtubetab': {'approximate_date': ['timestamp']}},
+}
+YDL_CHANNEL_OPTS = {
+    'quiet': True,
+    'extract_flat': True,
+    'playlistend': 1,
+}
+# Let yt-dlp stop after MAX_COMMENTS top comments instead of paging them all
+YDL_VIDEO_OPTS = {
+    'quiet': True,
+    'getcomments': True,
+    'extractor_args': {'youtube': {
+        'max_comments': [str(MAX_COMMENTS), 'all', '0', '0'],
+        'comment_sort': ['top'],
+    }},
+}
+YDL_VIDEO_INFO_OPTS = {
+    'quiet': True,
+    'getcomments': False,
+}
+YDL_RELATED_OPTS = {
+    'quiet': True,
+    'extract_flat': True,
+    'playlistend': 10,  # Get top 10 related videos
+    'getcomments': False,
+}
+
+# Shared HTTP session so repeated downloads reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = USER_AGENT
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+
+def polite_get(url, **kwargs):
+    """GET url on the shared session, backing off as asked when the server answers 429."""
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        response = SESSION.get(url, timeout=HTTP_TIMEOUT, **kwargs)
+        if response.status_code != 429 or attempt == HTTP_MAX_RETRIES:
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        delay = int(retry_after) if retry_after.isdigit() else 2 ** attempt
+        response.close()
+        time.sleep(min(delay, MAX_RETRY_AFTER))
+
+
+# Google dork templates per platform, filled from the target info
+DORK_TEMPLATES = {
+    'twitter': (
+        'site:twitter.com "{channel_name}"',
+        'site:twitter.com "{channel_id}"',
+        'site:twitter.com "{description:.50}"',
+    ),
+    'facebook': (
+        'site:facebook.com "{channel_name}"',
+        'site:facebook.com "{channel_id}"',
+    ),
+    'instagram': (
+        'site:instagram.com "{channel_name}"',
+        'site:instagram.com "{channel_id}"',
+    ),
+    'linkedin': (
+        'site:linkedin.com "{channel_name}"',
+        'site:linkedin.com "{channel_id}"',
+    ),
+    'tiktok': (
+        'site:tiktok.com "{channel_name}"',
+        'site:tiktok.com "{channel_id}"',
+    ),
+}
+
+
+def thumbnail_set(url):
+    """Build the API-style thumbnails mapping for a single yt-dlp thumbnail URL.
+
+    yt-dlp resolves one thumbnail, so every quality shares the same entry.
+    """
+    entry = {'url': url}
+    return {'default': entry, 'medium': entry, 'high': entry}
+
+
+# ---------------- CONCURRENT FETCHING ----------------------------------------
+def fetch_concurrently(fetch, items, aborted, max_workers=MAX_FETCH_WORKERS):
+    """Run fetch(item) for every item on a thread pool, yielding (item, future) as each completes.
+
+    Network-bound work (yt-dlp extraction, HTTP downloads) releases the GIL, so
+    the fetches overlap. Iteration stops and pending work is cancelled as soon
+    as aborted() returns True; fetches already running are waited for, so no
+    pool thread outlives the caller.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(fetch, item): item for item in items}
+        for future in as_completed(futures):
+            if aborted():
+                break
+            yield futures[future], future
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# ---------------- YT-DLP POOL ------------------------------------------------
+YDL_POOL_MAX_IDLE = MAX_FETCH_WORKERS  # idle instances kept per option set
+_YDL_PER_CALL_OPTS = ('playlistend',)  # applied on each borrow, not part of the pool key
+_YDL_POOL = {}
+_YDL_POOL_LOCK = threading.Lock()
+
+
+@contextmanager
+def pooled_ydl(opts):
+    """Borrow a YoutubeDL configured with opts, reusing idle instances across calls.
+
+    YoutubeDL is not safe for concurrent extractions, so a borrowed instance is
+    used exclusively until the block exits and then returned to the pool.
+    Per-call fields such as playlistend are set on the borrowed instance, so
+    calls differing only in those share one pool entry. Instances beyond
+    YDL_POOL_MAX_IDLE are closed rather than kept.
+    """
+    shared = {k: v for k, v in opts.items() if k not in _YDL_PER_CALL_OPTS}
+    key = json.dumps(shared, sort_keys=True)
+    with _YDL_POOL_LOCK:
+        idle = _YDL_POOL.setdefault(key, [])
+        ydl = idle.pop() if idle else None
+    if ydl is None:
+        ydl = ytdlp.YoutubeDL(dict(shared))
+    for field in _YDL_PER_CALL_OPTS:
+        if field in opts:
+            ydl.params[field] = opts[field]
+        else:
+            ydl.params.pop(field, None)
+    try:
+        yield ydl
+    finally:
+        with _YDL_POOL_LOCK:
+            idle = _YDL_POOL.setdefault(key, [])
+            keep = len(idle) < YDL_POOL_MAX_IDLE
+            if keep:
+                idle.append(ydl)
+        if not keep:
+            ydl.close()
+
+
+def close_ydl_pool():
+    """Close every idle pooled YoutubeDL, releasing its cookie jar and HTTP handlers."""
+    with _YDL_POOL_LOCK:
+        idle = [ydl for instances in _YDL_POOL.values() for ydl in instances]
+        _YDL_POOL.clear()
+    for ydl in idle:
+        ydl.close()
+
+
+# ---------------- SIGNAL BATCHING --------------------------------------------
+SIGNAL_INTERVAL = 0.033     # seconds between coalesced GUI updates (~30 Hz)
+
+
+class SignalBatcher:
+    """Coalesce a worker's progress/log emissions to at most one batch per interval.
+
+    Cross-thread signals are queued on the GUI event loop, so emitting on every
+    inner iteration floods it. Only the latest progress value is kept and log
+    lines are joined, and a progress value equal to the last one emitted is
+    dropped. Call flush() before the worker reports its result.
+    """
+
+    def __init__(self, progress_signal, log_signal, interval=SIGNAL_INTERVAL):
+        self._progress_signal = progress_signal
+        self._log_signal = log_signal
+        self._interval = interval
+        self._last_emit = 0.0
+        self._pending_progress = None
+        self._last_progress = None
+        self._log_buf = []
+        self._lock = threading.Lock()
+
+    def progress(self, value):
+        with self._lock:
+            self._pending_progress = value
+        self._maybe_flush()
+
+    def log(self, msg):
+        with self._lock:
+            self._log_buf.append(msg)
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if time.monotonic() - self._last_emit >= self._interval:
+            self.flush()
+
+    def flush(self):
+        """Emit whatever is pending right away."""
+        with self._lock:
+            self._last_emit = time.monotonic()
+            progress, self._pending_progress = self._pending_progress, None
+            if progress == self._last_progress:
+                progress = None
+            elif progress is not None:
+                self._last_progress = progress
+            lines, self._log_buf = self._log_buf, []
+        if lines:
+            self._log_signal.emit("\n".join(lines))
+        if progress is not None:
+            self._progress_signal.emit(progress)
+
+
+# ---------------- RATE LIMITING ----------------------------------------------
+class TokenBucket:
+    """Thread-safe token bucket that only blocks once callers exceed `rate` per second."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Consume one token, sleeping just long enough for one to become available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._last = time.monotonic()
+                self._tokens = 0
+            else:
+                self._tokens -= 1
+
+
+# ---------------- METADATA CACHE ---------------------------------------------
+def _cache_path(key):
+    return CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+
+def cache_get(key, ttl):
+    """Return the cached payload for key, or None if missing or older than ttl seconds."""
+    path = _cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(key, payload):
+    """Store payload under key; cache failures never break a lookup."""
+    path = _cache_path(key)
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp.write_bytes(json_dumps(payload))
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def cache_delete(key):
+    """Drop key from the cache so the next lookup re-fetches it."""
+    try:
+        _cache_path(key).unlink()
+    except OSError:
+        pass
+
+
+def _file_cache_path(url):
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return CACHE_DIR / "files" / digest[:2] / f"{digest}.bin"
+
+
+def file_cache_get(url, ttl):
+    """Return the path of a cached download of url, or None if missing or older than ttl seconds."""
+    path = _file_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+    except OSError:
+        return None
+    return path
+
+
+def file_cache_put(url, src_path):
+    """Keep a copy of a downloaded file for url; cache failures never break a download."""
+    path = _file_cache_path(url)
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(src_path, tmp)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+class MemoCache:
+    """Thread-safe in-process LRU used in front of repeated yt-dlp lookups.
+
+    Entries older than ttl seconds (if given) are treated as missing.
+    """
+
+    def __init__(self, capacity=1024, ttl=None):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._items = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            if len(self._items) > self.capacity:
+                self._items.popitem(last=False)
+
+
+# Per-video yt-dlp info shared by every analysis run in this session
+VIDEO_INFO_CACHE = MemoCache(ttl=VIDEO_CACHE_TTL)
 
 
 class YouTubeSearchThread(QThread):
@@ -34,26 +382,31 @@ class YouTubeSearchThread(QThread):
     error = pyqtSignal(str)
     log = pyqtSignal(str)
 
-    def __init__(self, query, search_type="video", max_results=50):
+    def __init__(self, query, search_type="video", max_results=50, refresh=False):
         super().__init__()
         self.query = query
         self.search_type = search_type
         self.max_results = max_results
+        self.refresh = refresh
         self._abort = False
 
     def run(self):
         try:
             self.log.emit(f"Searching YouTube ({self.search_type}s) for: {self.query}")
             
-            # Use yt-dlp to extract information
-            ydl_opts = {
-                'quiet': True,
-                'extract_flat': True,
-                'playlistend': self.max_results,
-                'default_search': 'ytsearch' + str(self.max_results),
-            }
+            cache_key = f"search:{self.search_type}:{self.max_results}:{self.query}"
+            if self.refresh:
+                cache_delete(cache_key)
+            else:
+                cached = cache_get(cache_key, SEARCH_CACHE_TTL)
+                if cached is not None:
+                    self.log.emit(f"Found {len(cached['items'])} {self.search_type}(s) (cached)")
+                    self.result_ready.emit(cached)
+                    return
+            
+            ydl_opts = {**YDL_SEARCH_OPTS, 'playlistend': self.max_results}
             
-            with ytdlp.YoutubeDL(ydl_opts) as ydl:
+            with pooled_ydl(ydl_opts) as ydl:
                 search_results = ydl.extract_info(f"ytsearch{self.max_results}:{self.query}", download=False)
             
             items = []
@@ -62,6 +415,14 @@ class YouTubeSearchThread(QThread):
                     if self._abort:
                         break
                     
+                    # Flat entries carry a thumbnail list and an approximate
+                    # timestamp rather than resolved 'thumbnail'/'upload_date'
+                    thumbnail = entry.get('thumbnail') or \
+                                (entry.get('thumbnails') or [{}])[-1].get('url', '')
+                    timestamp = entry.get('timestamp')
+                    published = entry.get('upload_date') or \
+                                (datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y%m%d') if timestamp else '')
+                    
                     # Convert yt-dlp format to API-like format
                     item = {
                         'id': {
@@ -70,20 +431,19 @@ class YouTubeSearchThread(QThread):
                         },
                         'snippet': {
                             'title': entry.get('title', ''),
-                            'description': entry.get('description', ''),
+                            'description': entry.get('description') or '',
                             'channelTitle': entry.get('channel', ''),
-                            'publishedAt': entry.get('upload_date', ''),
-                            'thumbnails': {
-                                'default': {'url': entry.get('thumbnail', '')},
-                                'medium': {'url': entry.get('thumbnail', '')},
-                                'high': {'url': entry.get('thumbnail', '')}
-                            }
+                            'publishedAt': published,
+                            'thumbnails': thumbnail_set(thumbnail)
                         }
                     }
                     items.append(item)
             
+            payload = {"type": self.search_type, "items": items}
+            if not self._abort:
+                cache_put(cache_key, payload)
             self.log.emit(f"Found {len(items)} {self.search_type}(s)")
-            self.result_ready.emit({"type": self.search_type, "items": items})
+            self.result_ready.emit(payload)
         except Exception as e:
             self.error.emit(str(e))
     
@@ -97,9 +457,10 @@ class ChannelDetailsThread(QThread):
     error = pyqtSignal(str)
     log = pyqtSignal(str)
 
-    def __init__(self, channel_url_or_id):
+    def __init__(self, channel_url_or_id, refresh=False):
         super().__init__()
         self.channel_url_or_id = channel_url_or_id
+        self.refresh = refresh
         self._abort = False
 
     def run(self):
@@ -107,25 +468,24 @@ class ChannelDetailsThread(QThread):
             self.log.emit(f"Fetching channel details for {self.channel_url_or_id}")
             
             # Handle both URLs and channel IDs
-            if self.channel_url_or_id.startswith(('http://', 'https://')):
-                channel_url = self.channel_url_or_id
+            channel_url = canonical_channel_url(self.channel_url_or_id)
+            
+            cache_key = f"channel:{channel_url}"
+            if self.refresh:
+                cache_delete(cache_key)
             else:
-                # Convert channel ID to URL
-                channel_url = f"https://www.youtube.com/channel/{self.channel_url_or_id}"
+                cached = cache_get(cache_key, SEARCH_CACHE_TTL)
+                if cached is not None:
+                    self.result_ready.emit(cached)
+                    return
             
             # Use yt-dlp to extract channel information
-            ydl_opts = {
-                'quiet': True,
-                'extract_flat': True,
-                'playlistend': 1,
-            }
-            
-            with ytdlp.YoutubeDL(ydl_opts) as ydl:
+            with pooled_ydl(YDL_CHANNEL_OPTS) as ydl:
                 try:
                     info = ydl.extract_info(channel_url, download=False)
                 except Exception as e:
                     # Try alternative URL format
-                    if not self.channel_url_or_id.startswith(('http://', 'https://')):
+                    if channel_url != self.channel_url_or_id:
                         channel_url = f"https://www.youtube.com/c/{self.channel_url_or_id}"
                         info = ydl.extract_info(channel_url, download=False)
                     else:
@@ -142,11 +502,7 @@ class ChannelDetailsThread(QThread):
                     'title': info.get('channel', ''),
                     'description': info.get('description', ''),
                     'publishedAt': info.get('upload_date', ''),
-                    'thumbnails': {
-                        'default': {'url': info.get('thumbnail', '')},
-                        'medium': {'url': info.get('thumbnail', '')},
-                        'high': {'url': info.get('thumbnail', '')}
-                    }
+                    'thumbnails': thumbnail_set(info.get('thumbnail') or '')
                 },
                 'statistics': {
                     'subscriberCount': info.get('channel_follower_count', 0),
@@ -160,6 +516,7 @@ class ChannelDetailsThread(QThread):
                 }
             }
             
+            cache_put(cache_key, channel_data)
             self.result_ready.emit(channel_data)
         except Exception as e:
             self.error.emit(str(e))
@@ -174,25 +531,28 @@ class VideoDetailsThread(QThread):
     error = pyqtSignal(str)
     log = pyqtSignal(str)
 
-    def __init__(self, video_url):
+    def __init__(self, video_url, refresh=False):
         super().__init__()
-        self.video_url = video_url
+        self.video_url = canonical_video_url(video_url)
+        self.refresh = refresh
         self._abort = False
 
     def run(self):
         try:
             self.log.emit(f"Fetching video details for {self.video_url}")
             
-            # Use yt-dlp to extract video information
-            ydl_opts = {
-                'quiet': True,
-                'getcomments': True,
-                'commentsort': 'top',
-                'writeinfojson': False,
-                'writethumbnail': False,
-            }
+            # Key on the bare video ID so URL variants share one entry
+            cache_key = f"video:{extract_video_id_from_url(self.video_url) or self.video_url}"
+            if self.refresh:
+                cache_delete(cache_key)
+            else:
+                cached = cache_get(cache_key, VIDEO_CACHE_TTL)
+                if cached is not None:
+                    self.result_ready.emit(cached)
+                    return
             
-            with ytdlp.YoutubeDL(ydl_opts) as ydl:
+            # Use yt-dlp to extract video information
+            with pooled_ydl(YDL_VIDEO_OPTS) as ydl:
                 info = ydl.extract_info(self.video_url, download=False)
             
             if not info:
@@ -207,11 +567,7 @@ class VideoDetailsThread(QThread):
                     'description': info.get('description', ''),
                     'channelTitle': info.get('channel', ''),
                     'publishedAt': info.get('upload_date', ''),
-                    'thumbnails': {
-                        'default': {'url': info.get('thumbnail', '')},
-                        'medium': {'url': info.get('thumbnail', '')},
-                        'high': {'url': info.get('thumbnail', '')}
-                    },
+                    'thumbnails': thumbnail_set(info.get('thumbnail') or ''),
                     'tags': info.get('tags', []),
                     'categoryId': str(info.get('category', 0)),
                     'liveBroadcastContent': 'none' if not info.get('is_live', False) else 'live',
@@ -244,7 +600,7 @@ class VideoDetailsThread(QThread):
             # Add comments if available
             if 'comments' in info:
                 comments = []
-                for comment in info['comments'][:20]:  # Limit to top 20 comments
+                for comment in info['comments'] or ():
                     if self._abort:
                         break
                     comments.append({
@@ -259,6 +615,8 @@ class VideoDetailsThread(QThread):
                     })
                 video_data['comments'] = comments
             
+            if not self._abort:
+                cache_put(cache_key, video_data)
             self.result_ready.emit(video_data)
         except Exception as e:
             self.error.emit(str(e))
@@ -267,59 +625,100 @@ class VideoDetailsThread(QThread):
         self._abort = True
 
 
+class _AbortableReader:
+    """File-like wrapper that stops a streamed copy once its owner aborts."""
+
+    def __init__(self, raw, aborted):
+        self._raw = raw
+        self._aborted = aborted
+
+    def read(self, size=-1):
+        if self._aborted():
+            raise InterruptedError("Download aborted")
+        return self._raw.read(size)
+
+
 class ProfileImageDownloadThread(QThread):
-    """Download high-quality profile images from YouTube channels."""
+    """Download high-quality profile images for a batch of YouTube channels."""
     download_complete = pyqtSignal(str, str)  # channel_id, file_path
     error = pyqtSignal(str)
     log = pyqtSignal(str)
+    progress = pyqtSignal(int)
 
-    def __init__(self, channel_data, output_dir):
+    def __init__(self, channels, output_dir):
         super().__init__()
-        self.channel_data = channel_data
+        self.channels = channels
         self.output_dir = output_dir
+        self._signals = SignalBatcher(self.progress, self.log)
         self._abort = False
 
     def run(self):
         try:
-            channel_id = self.channel_data.get('id', '')
-            channel_name = self.channel_data.get('snippet', {}).get('title', 'unknown')
+            total_channels = len(self.channels)
             
-            self.log.emit(f"Downloading profile image for channel: {channel_name}")
-            
-            # Get the highest quality thumbnail URL
-            thumbnails = self.channel_data.get('snippet', {}).get('thumbnails', {})
-            thumbnail_url = thumbnails.get('high', {}).get('url') or \
-                           thumbnails.get('medium', {}).get('url') or \
-                           thumbnails.get('default', {}).get('url')
-            
-            if not thumbnail_url:
-                self.error.emit(f"No thumbnail URL found for channel {channel_name}")
-                return
-            
-            # Create output directory if it doesn't exist
+            # Create output directory once for the whole batch
             os.makedirs(self.output_dir, exist_ok=True)
             
-            # Sanitize filename
-            safe_channel_name = re.sub(r'[^\w\-_\. ]', '_', channel_name)
-            filename = f"{safe_channel_name}_{channel_id}.jpg"
-            filepath = os.path.join(self.output_dir, filename)
-            
-            # Download the image
-            headers = {'User-Agent': USER_AGENT}
-            response = requests.get(thumbnail_url, headers=headers, stream=True)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self._abort:
-                        return
-                    f.write(chunk)
-            
-            self.log.emit(f"Profile image downloaded: {filename}")
-            self.download_complete.emit(channel_id, filepath)
+            completed = fetch_concurrently(self._download_one, self.channels, lambda: self._abort)
+            for i, (_, future) in enumerate(completed):
+                self._signals.progress(int((i + 1) / total_channels * 100))
+                
+                try:
+                    downloaded = future.result()
+                    if downloaded:
+                        self.download_complete.emit(*downloaded)
+                except Exception as e:
+                    self.error.emit(str(e))
             
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            self._signals.flush()
+    
+    def _download_one(self, channel_data):
+        """Download one channel's profile image; return (channel_id, file_path) or None."""
+        channel_id = channel_data.get('id', '')
+        channel_name = channel_data.get('snippet', {}).get('title', 'unknown')
+        
+        self._signals.log(f"Downloading profile image for channel: {channel_name}")
+        
+        # Get the highest quality thumbnail URL
+        thumbnails = channel_data.get('snippet', {}).get('thumbnails', {})
+        thumbnail_url = next((thumbnails[q]['url'] for q in THUMBNAIL_QUALITIES
+                              if thumbnails.get(q, {}).get('url')), None)
+        
+        if not thumbnail_url:
+            self.error.emit(f"No thumbnail URL found for channel {channel_name}")
+            return None
+        
+        # Sanitize filename
+        safe_channel_name = _FILENAME_UNSAFE_RE.sub('_', channel_name)[:MAX_FILENAME_STEM].strip(' .') or 'unknown'
+        filename = f"{safe_channel_name}_{channel_id}.jpg"
+        filepath = os.path.join(self.output_dir, filename)
+        
+        # Reuse an image fetched in an earlier batch or session
+        cached = file_cache_get(thumbnail_url, THUMBNAIL_CACHE_TTL)
+        if cached:
+            shutil.copyfile(cached, filepath)
+            self._signals.log(f"Profile image copied from cache: {filename}")
+            return channel_id, filepath
+        
+        # Download the image
+        with polite_get(thumbnail_url, stream=True) as response:
+            response.raise_for_status()
+            
+            response.raw.decode_content = True
+            try:
+                with open(filepath, 'wb') as f:
+                    shutil.copyfileobj(_AbortableReader(response.raw, lambda: self._abort), f,
+                                       length=COPY_BUFFER_SIZE)
+            except InterruptedError:
+                os.remove(filepath)  # Don't leave a truncated image behind
+                return None
+        
+        file_cache_put(thumbnail_url, filepath)
+        self._signals.log(f"Profile image downloaded: {filename}")
+        return channel_id, filepath
     
     def abort(self):
         self._abort = True
@@ -332,15 +731,17 @@ class GoogleDorkingThread(QThread):
     log = pyqtSignal(str)
     progress = pyqtSignal(int)
 
-    def __init__(self, target_info, platforms):
+    def __init__(self, target_info, platforms, queries_per_second=DORK_QUERIES_PER_SECOND):
         super().__init__()
         self.target_info = target_info
         self.platforms = platforms
+        self._bucket = TokenBucket(queries_per_second)
+        self._signals = SignalBatcher(self.progress, self.log)
         self._abort = False
 
     def run(self):
         try:
-            self.log.emit(f"Starting Google Dorking for target: {self.target_info}")
+            self._signals.log(f"Starting Google Dorking for target: {self.target_info}")
             results = {}
             
             total_platforms = len(self.platforms)
@@ -348,7 +749,7 @@ class GoogleDorkingThread(QThread):
                 if self._abort:
                     break
                 
-                self.progress.emit(int((i + 1) / total_platforms * 100))
+                self._signals.progress(int((i + 1) / total_platforms * 100))
                 
                 # Construct dork queries based on platform and target info
                 queries = self._construct_queries(platform, self.target_info)
@@ -363,58 +764,34 @@ class GoogleDorkingThread(QThread):
                         search_results = self._simulate_google_search(query)
                         platform_results.extend(search_results)
                     except Exception as e:
-                        self.log.emit(f"Error searching '{query}': {str(e)}")
+                        self._signals.log(f"Error searching '{query}': {str(e)}")
                 
                 results[platform] = platform_results
-                self.log.emit(f"Completed dorking for {platform}: {len(platform_results)} results")
+                self._signals.log(f"Completed dorking for {platform}: {len(platform_results)} results")
             
+            self._signals.flush()
             self.result_ready.emit(results)
             
         except Exception as e:
+            self._signals.flush()
             self.error.emit(str(e))
     
     def _construct_queries(self, platform, target_info):
         """Construct Google dork queries based on platform and target info."""
-        queries = []
-        channel_name = target_info.get('channel_name', '')
-        channel_id = target_info.get('channel_id', '')
-        description = target_info.get('description', '')
-        
-        if platform == 'twitter':
-            queries.extend([
-                f'site:twitter.com "{channel_name}"',
-                f'site:twitter.com "{channel_id}"',
-                f'site:twitter.com "{description[:50]}"'
-            ])
-        elif platform == 'facebook':
-            queries.extend([
-                f'site:facebook.com "{channel_name}"',
-                f'site:facebook.com "{channel_id}"'
-            ])
-        elif platform == 'instagram':
-            queries.extend([
-                f'site:instagram.com "{channel_name}"',
-                f'site:instagram.com "{channel_id}"'
-            ])
-        elif platform == 'linkedin':
-            queries.extend([
-                f'site:linkedin.com "{channel_name}"',
-                f'site:linkedin.com "{channel_id}"'
-            ])
-        elif platform == 'tiktok':
-            queries.extend([
-                f'site:tiktok.com "{channel_name}"',
-                f'site:tiktok.com "{channel_id}"'
-            ])
-        
-        return queries
+        fields = {
+            'channel_name': target_info.get('channel_name', ''),
+            'channel_id': target_info.get('channel_id', ''),
+            'description': target_info.get('description', ''),
+        }
+        # Empty or repeated fields render identical queries; issue each only once
+        return list(dict.fromkeys(template.format_map(fields) for template in DORK_TEMPLATES.get(platform, ())))
     
     def _simulate_google_search(self, query):
         """Simulate Google search (in real implementation, use Google API or scraping)."""
         # This is a simulation - in real implementation, you would use Google Custom Search API
         # or web scraping with proper error handling and rate limiting
         
-        time.sleep(0.5)  # Simulate network delay
+        self._bucket.take()  # Stay under the configured query rate
         
         # Return mock results
         return [
@@ -436,15 +813,17 @@ class DocumentIntelligenceThread(QThread):
     result_ready = pyqtSignal(dict)
     progress = pyqtSignal(int)
 
-    def __init__(self, target_info, search_engines):
+    def __init__(self, target_info, search_engines, queries_per_second=DOCUMENT_QUERIES_PER_SECOND):
         super().__init__()
         self.target_info = target_info
         self.search_engines = search_engines
+        self._bucket = TokenBucket(queries_per_second)
+        self._signals = SignalBatcher(self.progress, self.log)
         self._abort = False
 
     def run(self):
         try:
-            self.log.emit(f"Starting Document Intelligence Search with target info: {self.target_info}")
+            self._signals.log(f"Starting Document Intelligence Search with target info: {self.target_info}")
             results = {}
             
             total_engines = len(self.search_engines)
@@ -452,17 +831,19 @@ class DocumentIntelligenceThread(QThread):
                 if self._abort:
                     break
                 
-                self.progress.emit(int((i + 1) / total_engines * 100))
+                self._signals.progress(int((i + 1) / total_engines * 100))
                 
                 # Search for documents related to the target
                 engine_results = self._search_documents(engine, self.target_info)
                 results[engine] = engine_results
                 
-                self.log.emit(f"Completed document search on {engine}: {len(engine_results)} results")
+                self._signals.log(f"Completed document search on {engine}: {len(engine_results)} results")
             
+            self._signals.flush()
             self.result_ready.emit(results)
             
         except Exception as e:
+            self._signals.flush()
             self.error.emit(str(e))
     
     def _search_documents(self, engine, target_info):
@@ -470,7 +851,7 @@ class DocumentIntelligenceThread(QThread):
         # This is a simulation - in real implementation, you would use various APIs
         # or web scraping to find documents
         
-        time.sleep(1)  # Simulate search delay
+        self._bucket.take()  # Stay under the configured query rate
         
         # Mock document results
         return [
@@ -494,46 +875,51 @@ class VideoAnalysisThread(QThread):
     result_ready = pyqtSignal(dict)
     progress = pyqtSignal(int)
 
-    def __init__(self, api_key, video_ids):
+    def __init__(self, api_key, video_ids, refresh=False):
         super().__init__()
         self.api_key = api_key
-        self.video_ids = video_ids
+        # Duplicate ids would only repeat the same network fetch
+        self.video_ids = list(dict.fromkeys(video_ids))
+        self.refresh = refresh
+        self._signals = SignalBatcher(self.progress, self.log)
         self._abort = False
 
     def run(self):
         try:
-            self.log.emit(f"Starting enhanced video analysis for {len(self.video_ids)} videos...")
+            self._signals.log(f"Starting enhanced video analysis for {len(self.video_ids)} videos...")
             results = {"videos": [], "summary": self._initialize_summary()}
             
             total_videos = len(self.video_ids)
-            for i, video_id in enumerate(self.video_ids):
-                if self._abort:
-                    break
-                
-                self.progress.emit(int((i + 1) / total_videos * 100))
+            analyzed = {}
+            
+            # Fetches run on the pool; analysis stays on this worker thread
+            completed = fetch_concurrently(self._get_video_data, self.video_ids, lambda: self._abort)
+            for i, (video_id, future) in enumerate(completed):
+                self._signals.progress(int((i + 1) / total_videos * 100))
                 
                 try:
-                    # Get video data using yt-dlp
-                    video_data = self._get_video_data(video_id)
+                    video_data = future.result()
                     if video_data:
                         # Perform analysis
                         analyzed_video = self._analyze_video(video_data)
-                        results["videos"].append(analyzed_video)
-                        
-                        # Update summary statistics
-                        self._update_summary_statistics(results, analyzed_video)
+                        analyzed[video_id] = analyzed_video
                         
-                        self.log.emit(f"Analyzed video: {video_data.get('title', video_id)}")
+                        self._signals.log(f"Analyzed video: {video_data.get('title', video_id)}")
                 
                 except Exception as e:
-                    self.log.emit(f"Error analyzing video {video_id}: {str(e)}")
+                    self._signals.log(f"Error analyzing video {video_id}: {str(e)}")
+            
+            # Keep the caller's ordering regardless of completion order
+            results["videos"] = [analyzed[v] for v in self.video_ids if v in analyzed]
             
             # Calculate final summary metrics
             self._calculate_final_summary(results)
             
+            self._signals.flush()
             self.result_ready.emit(results)
             
         except Exception as e:
+            self._signals.flush()
             self.error.emit(str(e))
     
     def _initialize_summary(self):
@@ -549,21 +935,20 @@ class VideoAnalysisThread(QThread):
         }
     
     def _get_video_data(self, video_id):
-        """Get video data using yt-dlp."""
+        """Get video data using yt-dlp, reusing anything fetched earlier this session unless refreshing."""
+        cache_key = extract_video_id_from_url(video_id) or video_id
+        cached = None if self.refresh else VIDEO_INFO_CACHE.get(cache_key)
+        if cached is not None:
+            # _analyze_video adds keys to the dict it is given
+            return dict(cached)
+        
         try:
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
-            ydl_opts = {
-                'quiet': True,
-                'getcomments': False,
-                'writeinfojson': False,
-                'writethumbnail': False,
-            }
-            
-            with ytdlp.YoutubeDL(ydl_opts) as ydl:
+            video_url = canonical_video_url(video_id)
+            with pooled_ydl(YDL_VIDEO_INFO_OPTS) as ydl:
                 info = ydl.extract_info(video_url, download=False)
             
             if info:
-                return {
+                video_data = {
                     'id': info.get('id', ''),
                     'title': info.get('title', ''),
                     'description': info.get('description', ''),
@@ -573,27 +958,31 @@ class VideoAnalysisThread(QThread):
                     'comment_count': info.get('comment_count', 0),
                     'duration': info.get('duration', 0),
                     'upload_date': info.get('upload_date', ''),
-                    'tags': info.get('tags', []),
+                    # Normalised once here so analysis never re-lowercases tags
+                    'tags': [sys.intern(tag.lower()) for tag in info.get('tags') or ()],
                     'category': info.get('category', ''),
+                    'caption': bool(info.get('subtitles')),
                     'thumbnail': info.get('thumbnail', '')
                 }
+                VIDEO_INFO_CACHE.put(cache_key, video_data)
+                return dict(video_data)
         
         except Exception as e:
-            self.log.emit(f"Error fetching video data for {video_id}: {str(e)}")
+            self._signals.log(f"Error fetching video data for {video_id}: {str(e)}")
             return None
     
     def _analyze_video(self, video_data):
         """Perform comprehensive analysis on video data."""
         # Calculate engagement metrics
-        view_count = video_data.get("view_count", 0)
-        like_count = video_data.get("like_count", 0)
-        comment_count = video_data.get("comment_count", 0)
+        view_count = video_data.get("view_count") or 0
+        like_count = video_data.get("like_count") or 0
+        comment_count = video_data.get("comment_count") or 0
+        
+        # Divide by the view count once; every per-view rate below reuses it
+        inv_views = 1 / view_count if view_count > 0 else 0
         
         # Engagement rate calculation
-        if view_count > 0:
-            engagement_rate = ((like_count + comment_count) / view_count) * 100
-        else:
-            engagement_rate = 0
+        engagement_rate = (like_count + comment_count) * inv_views * 100
         
         # Determine engagement level
         if engagement_rate >= 5:
@@ -623,9 +1012,10 @@ class VideoAnalysisThread(QThread):
         video_data["performance_analytics"] = {
             "performance_score": round(performance_score, 2),
             "performance_category": self._get_performance_category(performance_score),
-            "growth_potential": self._calculate_growth_potential(video_data),
+            "growth_potential": self._calculate_growth_potential(
+                engagement_score, virality_score, performance_score),
             "content_effectiveness": self._calculate_content_effectiveness(video_data),
-            "audience_retention": self._simulate_audience_retention(video_data)
+            "audience_retention": self._simulate_audience_retention(video_data, like_count * inv_views)
         }
         
         return video_data
@@ -633,8 +1023,8 @@ class VideoAnalysisThread(QThread):
     def _calculate_content_effectiveness(self, video_data):
         """Calculate content effectiveness based on various factors."""
         description_length = len(video_data.get("description", ""))
-        tag_count = len(video_data.get("tags", []))
-        has_caption = video_data.get("caption") == "true"
+        tag_count = len(video_data.get("tags") or ())
+        has_caption = video_data.get("caption", False)
         
         # Score based on content optimization
         description_score = min(100, description_length / 10)  # 1 point per 10 characters
@@ -644,20 +1034,12 @@ class VideoAnalysisThread(QThread):
         content_effectiveness = (description_score * 0.4) + (tag_score * 0.4) + (caption_score * 0.2)
         return content_effectiveness
     
-    def _simulate_audience_retention(self, video_data):
-        """Simulate audience retention based on video characteristics."""
-        duration = video_data.get("duration", "")
-        like_count = video_data.get("like_count", 0)
-        view_count = video_data.get("view_count", 0)
+    def _simulate_audience_retention(self, video_data, engagement_ratio):
+        """Simulate audience retention from duration and the likes-per-view ratio."""
+        duration = video_data.get("duration", 0)
         
         # Parse duration to seconds
-        duration_seconds = self._parse_duration(duration)
-        
-        # Calculate engagement ratio
-        if view_count > 0:
-            engagement_ratio = like_count / view_count
-        else:
-            engagement_ratio = 0
+        duration_seconds = parse_duration_from_iso(duration)
         
         # Duration factor (longer videos typically have lower retention)
         duration_factor = max(0.3, 1 - (duration_seconds / 3600))  # Reduce retention for very long videos
@@ -666,25 +1048,8 @@ class VideoAnalysisThread(QThread):
         retention_rate = (engagement_ratio * 100) * duration_factor
         return min(95, max(5, retention_rate))
     
-    def _parse_duration(self, duration_str):
-        """Parse ISO 8601 duration string to seconds."""
-        import re
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str)
-        if match:
-            hours, minutes, seconds = match.groups()
-            hours = int(hours) if hours else 0
-            minutes = int(minutes) if minutes else 0
-            seconds = int(seconds) if seconds else 0
-            return hours * 3600 + minutes * 60 + seconds
-        return 0
-    
-    def _calculate_growth_potential(self, video_data):
+    def _calculate_growth_potential(self, engagement_score, virality_score, performance_score):
         """Calculate growth potential based on current performance and trends."""
-        engagement_score = video_data.get("engagement_metrics", {}).get("engagement_score", 0)
-        virality_score = video_data.get("engagement_metrics", {}).get("virality_score", 0)
-        performance_score = video_data.get("performance_analytics", {}).get("performance_score", 0)
-        
         # Growth potential based on multiple factors
         growth_potential = (engagement_score * 0.4) + (virality_score * 0.3) + (performance_score * 0.3)
         return growth_potential
@@ -700,37 +1065,33 @@ class VideoAnalysisThread(QThread):
         else:
             return "Below Average"
     
-    def _update_summary_statistics(self, results, video_data):
-        """Update summary statistics with video data."""
-        view_count = video_data.get("view_count", 0)
-        like_count = video_data.get("like_count", 0)
-        comment_count = video_data.get("comment_count", 0)
-        engagement_level = video_data.get("engagement_metrics", {}).get("engagement_level", "low")
-        
-        results["summary"]["total_views"] += view_count
-        results["summary"]["total_likes"] += like_count
-        results["summary"]["total_comments"] += comment_count
-        results["summary"]["engagement_distribution"][engagement_level] += 1
-    
     def _calculate_final_summary(self, results):
-        """Calculate final summary metrics."""
-        total_views = results["summary"]["total_views"]
-        total_likes = results["summary"]["total_likes"]
-        total_comments = results["summary"]["total_comments"]
-        total_videos = results["summary"]["total_videos"]
+        """Calculate summary metrics once all videos have been analyzed."""
+        videos = results["videos"]
+        summary = results["summary"]
+        
+        total_views = sum(v.get("view_count") or 0 for v in videos)
+        total_likes = sum(v.get("like_count") or 0 for v in videos)
+        total_comments = sum(v.get("comment_count") or 0 for v in videos)
+        
+        summary["total_videos"] = len(videos)
+        summary["total_views"] = total_views
+        summary["total_likes"] = total_likes
+        summary["total_comments"] = total_comments
+        
+        summary["engagement_distribution"].update(
+            Counter(v["engagement_metrics"]["engagement_level"] for v in videos))
         
         if total_views > 0:
             avg_engagement_rate = ((total_likes + total_comments) / total_views) * 100
         else:
             avg_engagement_rate = 0
         
-        results["summary"]["average_engagement_rate"] = round(avg_engagement_rate, 2)
+        summary["average_engagement_rate"] = round(avg_engagement_rate, 2)
         
-        # Find top performing videos
-        sorted_videos = sorted(results["videos"], 
-                             key=lambda x: x.get("performance_analytics", {}).get("performance_score", 0), 
-                             reverse=True)
-        results["summary"]["top_performing_videos"] = sorted_videos[:5]  # Top 5
+        # Find top performing videos without sorting the whole list
+        summary["top_performing_videos"] = heapq.nlargest(
+            5, videos, key=lambda x: x.get("performance_analytics", {}).get("performance_score", 0))
     
     def abort(self):
         self._abort = True
@@ -746,48 +1107,45 @@ class RelatedVideosThread(QThread):
     def __init__(self, api_key, video_ids):
         super().__init__()
         self.api_key = api_key
-        self.video_ids = video_ids
+        # Duplicate ids would only repeat the same network fetch
+        self.video_ids = list(dict.fromkeys(video_ids))
+        self._signals = SignalBatcher(self.progress, self.log)
         self._abort = False
 
     def run(self):
         try:
-            self.log.emit(f"Starting related videos extraction for {len(self.video_ids)} videos...")
+            self._signals.log(f"Starting related videos extraction for {len(self.video_ids)} videos...")
             results = {}
             
             total_videos = len(self.video_ids)
-            for i, video_id in enumerate(self.video_ids):
-                if self._abort:
-                    break
-                
-                self.progress.emit(int((i + 1) / total_videos * 100))
+            completed = fetch_concurrently(self._get_related_videos, self.video_ids, lambda: self._abort)
+            for i, (video_id, future) in enumerate(completed):
+                self._signals.progress(int((i + 1) / total_videos * 100))
                 
                 try:
                     # Get related videos using yt-dlp
-                    related_videos = self._get_related_videos(video_id)
+                    related_videos = future.result()
                     results[video_id] = related_videos
                     
-                    self.log.emit(f"Extracted {len(related_videos)} related videos for {video_id}")
+                    self._signals.log(f"Extracted {len(related_videos)} related videos for {video_id}")
                 
                 except Exception as e:
-                    self.log.emit(f"Error extracting related videos for {video_id}: {str(e)}")
+                    self._signals.log(f"Error extracting related videos for {video_id}: {str(e)}")
             
+            # Keep the caller's ordering regardless of completion order
+            results = {v: results[v] for v in self.video_ids if v in results}
+            self._signals.flush()
             self.result_ready.emit(results)
             
         except Exception as e:
+            self._signals.flush()
             self.error.emit(str(e))
     
     def _get_related_videos(self, video_id):
         """Get related videos using yt-dlp."""
         try:
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
-            ydl_opts = {
-                'quiet': True,
-                'extract_flat': True,
-                'playlistend': 10,  # Get top 10 related videos
-                'getcomments': False,
-            }
-            
-            with ytdlp.YoutubeDL(ydl_opts) as ydl:
+            video_url = canonical_video_url(video_id)
+            with pooled_ydl(YDL_RELATED_OPTS) as ydl:
                 info = ydl.extract_info(video_url, download=False)
             
             related_videos = []
@@ -808,8 +1166,45 @@ class RelatedVideosThread(QThread):
             return related_videos
         
         except Exception as e:
-            self.log.emit(f"Error getting related videos for {video_id}: {str(e)}")
+            self._signals.log(f"Error getting related videos for {video_id}: {str(e)}")
             return []
     
     def abort(self):
         self._abort = True
+
+
+class CsvExportThread(QThread):
+    """Worker thread that writes result items to a CSV file row by row."""
+    log = pyqtSignal(str)
+    error = pyqtSignal(str)
+    result_ready = pyqtSignal(dict)
+    progress = pyqtSignal(int)
+
+    def __init__(self, items, path):
+        super().__init__()
+        self.items = list(items)
+        self.path = path
+        self._signals = SignalBatcher(self.progress, self.log)
+        self._abort = False
+
+    def run(self):
+        try:
+            total = len(self.items) or 1
+            rows = 0
+            with open(self.path, "w", newline='', encoding="utf-8") as fh:
+                writer = csv.writer(fh)
+                writer.writerow(CSV_HEADER)
+                for i, item in enumerate(self.items):
+                    if self._abort:
+                        break
+                    writer.writerow(flatten_item(item))
+                    rows += 1
+                    self._signals.progress(int((i + 1) / total * 100))
+            self._signals.flush()
+            self.result_ready.emit({'path': self.path, 'rows': rows})
+        except Exception as e:
+            self._signals.flush()
+            self.error.emit(str(e))
+
+    def abort(self):
+        self._abort = True
@@ -5,10 +5,87 @@ Contains utility functions and helpers for the YouTube OSINT Tool.
 
 import re
 import json
-import csv
-import os
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple
+
+# orjson is an optional fast path; fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_SCHEME_RE = re.compile(r'^https?://')
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+
+# Social-media extractors, compiled once at import; each key maps to the
+# patterns whose matches are merged for it
+_SOCIAL_MEDIA_PATTERNS = {
+    # Email addresses with various formats
+    "email": (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'),),
+    
+    # Twitter/X handles and URLs
+    "twitter": (re.compile(r'(?:https?://(?:www\.)?(?:twitter\.com|x\.com)/([A-Za-z0-9_]{1,15})|@([A-Za-z0-9_]{1,15}))\b'),
+                re.compile(r'twitter\.com/([A-Za-z0-9_]{1,15})')),
+    
+    # Instagram handles and URLs
+    "instagram": (re.compile(r'(?:https?://(?:www\.)?instagram\.com/([A-Za-z0-9_.]{1,30})|@([A-Za-z0-9_.]{1,30}))\b'),
+                  re.compile(r'instagram\.com/([A-Za-z0-9_.]{1,30})')),
+    
+    # Facebook pages, profiles, and groups
+    "facebook": (re.compile(r'(?:https?://(?:www\.)?facebook\.com/(?:pages/|profile\.php\?id=)?([A-Za-z0-9_.-]+)|fb\.com/([A-Za-z0-9_.-]+))'),
+                 re.compile(r'facebook\.com/groups/([A-Za-z0-9_.-]+)')),
+    
+    # TikTok usernames and URLs
+    "tiktok": (re.compile(r'(?:https?://(?:www\.)?tiktok\.com/@?([A-Za-z0-9_.]{1,24})|@([A-Za-z0-9_.]{1,24}))\b'),
+               re.compile(r'tiktok\.com/@?([A-Za-z0-9_.]{1,24})')),
+    
+    # Discord server invites and community links
+    "discord": (re.compile(r'(?:discord\.gg/([\w-]+)|discordapp\.com/invite/([\w-]+)|discord\.com/invite/([\w-]+))'),
+                re.compile(r'discord\.gg/([\w-]+)')),
+    
+    # Telegram channels, groups, and bots
+    "telegram": (re.compile(r'(?:t\.me/|telegram\.me/|telegram\.dog/)([A-Za-z0-9_]{5,32})'),
+                 re.compile(r't\.me/([A-Za-z0-9_]{5,32})')),
+    
+    # Websites and domains
+    "website": (re.compile(r'https?://(?:www\.)?([A-Za-z0-9_.-]+\.[A-Za-z]{2,})(?:/[A-Za-z0-9_.-]*)?'),
+                re.compile(r'(?:www\.)?([A-Za-z0-9_.-]+\.[A-Za-z]{2,})')),
+    
+    # Phone numbers, optionally prefixed with a 1-3 digit country code
+    "phone": (re.compile(r'(?:\+?\d{1,3}\s?)?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),),
+    
+    # LinkedIn profiles and company pages
+    "linkedin": (re.compile(r'(?:https?://(?:www\.)?linkedin\.com/(?:in/|company/)([A-Za-z0-9_-]+))'),
+                 re.compile(r'linkedin\.com/(?:in/|company/)([A-Za-z0-9_-]+)')),
+    
+    # YouTube channel handles and custom URLs
+    "youtube": (re.compile(r'(?:https?://(?:www\.)?youtube\.com/(?:channel/|c/|user/|@)([A-Za-z0-9_-]+))'),
+                re.compile(r'youtube\.com/(?:channel/|c/|user/|@)([A-Za-z0-9_-]+)')),
+    
+    # Reddit usernames and subreddits
+    "reddit": (re.compile(r'(?:https?://(?:www\.)?reddit\.com/(?:u/|user/|r/)([A-Za-z0-9_-]+))'),
+               re.compile(r'reddit\.com/(?:u/|user/|r/)([A-Za-z0-9_-]+)')),
+    
+    # Twitch usernames
+    "twitch": (re.compile(r'(?:https?://(?:www\.)?twitch\.tv/([A-Za-z0-9_]+))'),
+               re.compile(r'twitch\.tv/([A-Za-z0-9_]+)')),
+    
+    # Snapchat usernames
+    "snapchat": (re.compile(r'(?:https?://(?:www\.)?snapchat\.com/add/([A-Za-z0-9_.-]+))'),
+                 re.compile(r'snapchat\.com/add/([A-Za-z0-9_.-]+)')),
+    
+    # Pinterest profiles and boards
+    "pinterest": (re.compile(r'(?:https?://(?:www\.)?pinterest\.(?:com|co\.uk|fr|de|it|es)/(?:[A-Za-z0-9_.-]+))'),
+                  re.compile(r'pinterest\.(?:com|co\.uk|fr|de|it|es)/([A-Za-z0-9_.-]+)')),
+    
+    # GitHub repositories and user profiles
+    "github": (re.compile(r'(?:https?://(?:www\.)?github\.com/([A-Za-z0-9_.-]+)(?:/[A-Za-z0-9_.-]+)?)'),
+               re.compile(r'github\.com/([A-Za-z0-9_.-]+)(?:/[A-Za-z0-9_.-]+)?')),
+}
 
 
 def extract_social_media(text: str) -> Dict[str, List[str]]:
@@ -21,96 +98,34 @@ def extract_social_media(text: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary with social media platform names as keys and lists of found identifiers as values
     """
-    data = {
-        # Email addresses with various formats
-        "email": list(set(re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', text))),
-        
-        # Twitter/X handles and URLs
-        "twitter": list(set(re.findall(r'(?:https?://(?:www\.)?(?:twitter\.com|x\.com)/([A-Za-z0-9_]{1,15})|@([A-Za-z0-9_]{1,15}))\b', text))) + 
-                 list(set(re.findall(r'twitter\.com/([A-Za-z0-9_]{1,15})', text))),
-        
-        # Instagram handles and URLs
-        "instagram": list(set(re.findall(r'(?:https?://(?:www\.)?instagram\.com/([A-Za-z0-9_.]{1,30})|@([A-Za-z0-9_.]{1,30}))\b', text))) + 
-                   list(set(re.findall(r'instagram\.com/([A-Za-z0-9_.]{1,30})', text))),
-        
-        # Facebook pages, profiles, and groups
-        "facebook": list(set(re.findall(r'(?:https?://(?:www\.)?facebook\.com/(?:pages/|profile\.php\?id=)?([A-Za-z0-9_.-]+)|fb\.com/([A-Za-z0-9_.-]+))', text))) + 
-                   list(set(re.findall(r'facebook\.com/groups/([A-Za-z0-9_.-]+)', text))),
-        
-        # TikTok usernames and URLs
-        "tiktok": list(set(re.findall(r'(?:https?://(?:www\.)?tiktok\.com/@?([A-Za-z0-9_.]{1,24})|@([A-Za-z0-9_.]{1,24}))\b', text))) + 
-                 list(set(re.findall(r'tiktok\.com/@?([A-Za-z0-9_.]{1,24})', text))),
-        
-        # Discord server invites and community links
-        "discord": list(set(re.findall(r'(?:discord\.gg/([\w-]+)|discordapp\.com/invite/([\w-]+)|discord\.com/invite/([\w-]+))', text))) + 
-                 list(set(re.findall(r'discord\.gg/([\w-]+)', text))),
-        
-        # Telegram channels, groups, and bots
-        "telegram": list(set(re.findall(r'(?:t\.me/|telegram\.me/|telegram\.dog/)([A-Za-z0-9_]{5,32})', text))) + 
-                   list(set(re.findall(r't\.me/([A-Za-z0-9_]{5,32})', text))),
-        
-        # Websites and domains
-        "website": list(set(re.findall(r'https?://(?:www\.)?([A-Za-z0-9_.-]+\.[A-Za-z]{2,})(?:/[A-Za-z0-9_.-]*)?', text))) + 
-                 list(set(re.findall(r'(?:www\.)?([A-Za-z0-9_.-]+\.[A-Za-z]{2,})', text))),
-        
-        # Phone numbers with various international formats
-        "phone": list(set(re.findall(r'(?:\+?(?:1|44|91|61|86|49|33|81|82|55|52|34|39|31|46|47|45|43|41|48|351|353|358|372|371|370|375|380|996|995|994|993|992|976|975|974|973|972|971|968|967|966|965|964|963|962|961|880|855|856|95|94|93|92|91|90|98|20|27|234|233|232|231|225|224|223|221|220|218|213|212|211|98|971|966|965|964|963|962|961|968|967|972|973|974|975|976|977|94|93|92|91|90|81|82|86|852|853|886|65|60|63|62|84|855|856|95|673|674|675|676|679|680|685|689|682|683|686|687|689|690|691|692|699|670|672|673|674|675|676|677|678|679|680|681|682|683|684|685|686|687|688|689|690|691|692|693|694|695|696|697|698|699)\s?)?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text))) + 
-                 list(set(re.findall(r'(?:\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', text))),
-        
-        # LinkedIn profiles and company pages
-        "linkedin": list(set(re.findall(r'(?:https?://(?:www\.)?linkedin\.com/(?:in/|company/)([A-Za-z0-9_-]+))', text))) + 
-                  list(set(re.findall(r'linkedin\.com/(?:in/|company/)([A-Za-z0-9_-]+)', text))),
-        
-        # YouTube channel handles and custom URLs
-        "youtube": list(set(re.findall(r'(?:https?://(?:www\.)?youtube\.com/(?:channel/|c/|user/|@)([A-Za-z0-9_-]+))', text))) + 
-                  list(set(re.findall(r'youtube\.com/(?:channel/|c/|user/|@)([A-Za-z0-9_-]+)', text))),
-        
-        # Reddit usernames and subreddits
-        "reddit": list(set(re.findall(r'(?:https?://(?:www\.)?reddit\.com/(?:u/|user/|r/)([A-Za-z0-9_-]+))', text))) + 
-                 list(set(re.findall(r'reddit\.com/(?:u/|user/|r/)([A-Za-z0-9_-]+)', text))),
-        
-        # Twitch usernames
-        "twitch": list(set(re.findall(r'(?:https?://(?:www\.)?twitch\.tv/([A-Za-z0-9_]+))', text))) + 
-                  list(set(re.findall(r'twitch\.tv/([A-Za-z0-9_]+)', text))),
-        
-        # Snapchat usernames
-        "snapchat": list(set(re.findall(r'(?:https?://(?:www\.)?snapchat\.com/add/([A-Za-z0-9_.-]+))', text))) + 
-                    list(set(re.findall(r'snapchat\.com/add/([A-Za-z0-9_.-]+)', text))),
-        
-        # Pinterest profiles and boards
-        "pinterest": list(set(re.findall(r'(?:https?://(?:www\.)?pinterest\.(?:com|co\.uk|fr|de|it|es)/(?:[A-Za-z0-9_.-]+))', text))) + 
-                     list(set(re.findall(r'pinterest\.(?:com|co\.uk|fr|de|it|es)/([A-Za-z0-9_.-]+)', text))),
-        
-        # GitHub repositories and user profiles
-        "github": list(set(re.findall(r'(?:https?://(?:www\.)?github\.com/([A-Za-z0-9_.-]+)(?:/[A-Za-z0-9_.-]+)?)', text))) + 
-                 list(set(re.findall(r'github\.com/([A-Za-z0-9_.-]+)(?:/[A-Za-z0-9_.-]+)?', text)))
-    }
-    
-    # Clean up the data by removing empty strings and duplicates
-    cleaned_data = {}
-    for key, values in data.items():
-        if isinstance(values, list):
-            # Flatten nested tuples from regex groups
-            flat_values = []
-            for item in values:
-                if isinstance(item, tuple):
-                    for subitem in item:
-                        if subitem and subitem.strip():
-                            flat_values.append(subitem.strip())
-                elif item and item.strip():
-                    flat_values.append(item.strip())
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_values = []
-            for value in flat_values:
-                if value not in seen:
-                    seen.add(value)
-                    unique_values.append(value)
-            cleaned_data[key] = unique_values
-        else:
-            cleaned_data[key] = values
-    
-    return cleaned_data
+    return {key: list(values) for key, values in _extract_social_media_cached(text)}
+
+
+@lru_cache(maxsize=4096)
+def _extract_social_media_cached(text: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    Scan a description once; the result is frozen so repeated renders and
+    exports of the same item share it.
+    """
+    cleaned_data = []
+    for key, patterns in _SOCIAL_MEDIA_PATTERNS.items():
+        # Strip, drop empty groups and remove duplicates while preserving order
+        values = (match.strip() for pattern in patterns for match in _findall_flat(pattern, text))
+        cleaned_data.append((key, tuple(dict.fromkeys(filter(None, values)))))
+    return tuple(cleaned_data)
+
+
+def _findall_flat(pattern: re.Pattern, text: str):
+    """Return pattern's matches in text, with multi-group matches flattened into their groups."""
+    matches = pattern.findall(text)
+    return chain.from_iterable(matches) if pattern.groups > 1 else matches
+
+
+# Column order of the rows produced by flatten_item
+CSV_HEADER = ["type", "id", "title", "channel", "published",
+              "description", "viewCount", "subscriberCount",
+              "email", "twitter", "instagram", "facebook",
+              "tiktok", "discord", "telegram", "website", "phone"]
 
 
 def flatten_item(item: Dict[str, Any]) -> List[str]:
@@ -152,19 +167,20 @@ def flatten_item(item: Dict[str, Any]) -> List[str]:
     return ["", "", "", "", "", "", "", "", "", "", "", "", "", "", "", "", ""]
 
 
-def parse_duration_from_iso(duration_str: str) -> int:
+def parse_duration_from_iso(duration_str: Any) -> int:
     """
     Parse ISO 8601 duration string to seconds.
     
     Args:
-        duration_str: ISO 8601 duration string (e.g., "PT1H30M15S")
+        duration_str: ISO 8601 duration string (e.g., "PT1H30M15S"), or a
+            number of seconds as reported by yt-dlp
         
     Returns:
         Duration in seconds
     """
-    import re
-    pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-    match = re.match(pattern, duration_str)
+    if isinstance(duration_str, (int, float)):
+        return int(duration_str)
+    match = _DURATION_RE.match(duration_str or '')
     if match:
         hours = int(match.group(1) or 0)
         minutes = int(match.group(2) or 0)
@@ -193,6 +209,14 @@ def format_duration(seconds: int) -> str:
         return f"{minutes}:{seconds:02d}"
 
 
+# Background colors for the engagement levels reported by video analysis
+ENGAGEMENT_COLORS = {
+    "high": "#90EE90",  # Light green
+    "medium": "#FFE4B5",  # Light orange
+    "low": "#FFB6C1"  # Light pink
+}
+
+
 def get_engagement_color(engagement_level: str) -> str:
     """
     Get background color for engagement level.
@@ -203,12 +227,7 @@ def get_engagement_color(engagement_level: str) -> str:
     Returns:
         Hex color code
     """
-    colors = {
-        "high": "#90EE90",  # Light green
-        "medium": "#FFE4B5",  # Light orange
-        "low": "#FFB6C1"  # Light pink
-    }
-    return colors.get(engagement_level, "#FFFFFF")
+    return ENGAGEMENT_COLORS.get(engagement_level, "#FFFFFF")
 
 
 def extract_video_ids(results: List[Dict[str, Any]]) -> List[str]:
@@ -272,6 +291,37 @@ def extract_target_info(results: List[Dict[str, Any]]) -> Dict[str, str]:
     return target_info
 
 
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when available.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse a JSON document, using orjson when available.
+    
+    Args:
+        data: Encoded JSON document
+        
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def safe_get_nested(data: Dict[str, Any], keys: List[str], default: Any = None) -> Any:
     """
     Safely get nested dictionary values.
@@ -344,6 +394,38 @@ def is_valid_youtube_url(url: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=4096)
+def canonical_video_url(url_or_id: str) -> str:
+    """
+    Build a full watch URL from a video URL or bare video ID.
+    
+    Args:
+        url_or_id: YouTube video URL or 11-character video ID
+        
+    Returns:
+        The URL unchanged if it already has a scheme, otherwise a watch URL
+    """
+    if _SCHEME_RE.match(url_or_id):
+        return url_or_id
+    return f"https://www.youtube.com/watch?v={url_or_id}"
+
+
+@lru_cache(maxsize=4096)
+def canonical_channel_url(url_or_id: str) -> str:
+    """
+    Build a full channel URL from a channel URL or bare channel ID.
+    
+    Args:
+        url_or_id: YouTube channel URL or channel ID
+        
+    Returns:
+        The URL unchanged if it already has a scheme, otherwise a /channel/ URL
+    """
+    if _SCHEME_RE.match(url_or_id):
+        return url_or_id
+    return f"https://www.youtube.com/channel/{url_or_id}"
+
+
 def extract_video_id_from_url(url: str) -> Optional[str]:
     """
     Extract video ID from YouTube URL.